@@ -2,59 +2,45 @@
 """
 DaVinci Resolve MCP Tools - Split Module
 Provides registration functions for all MCP tools and resources.
+
+Registration functions are resolved lazily (PEP 562) so importing this
+package does not pull in every tool submodule up front.
 """
 
-from .core import register_core_tools
-from .project import register_project_tools
-from .timeline import register_timeline_tools
-from .media import register_media_tools
-from .color import register_color_tools
-from .delivery import register_delivery_tools
-from .cache import register_cache_tools
-from .timeline_items import register_timeline_item_tools
-from .keyframes import register_keyframe_tools
-from .presets import register_preset_tools
-from .inspection import register_inspection_tools
-from .layout import register_layout_tools
-from .app import register_app_tools
-from .cloud import register_cloud_tools
-from .properties import register_property_tools
-
-
-def register_all_tools(mcp, resolve, logger):
-    """Register all MCP tools and resources."""
-    register_core_tools(mcp, resolve, logger)
-    register_project_tools(mcp, resolve, logger)
-    register_timeline_tools(mcp, resolve, logger)
-    register_media_tools(mcp, resolve, logger)
-    register_color_tools(mcp, resolve, logger)
-    register_delivery_tools(mcp, resolve, logger)
-    register_cache_tools(mcp, resolve, logger)
-    register_timeline_item_tools(mcp, resolve, logger)
-    register_keyframe_tools(mcp, resolve, logger)
-    register_preset_tools(mcp, resolve, logger)
-    register_inspection_tools(mcp, resolve, logger)
-    register_layout_tools(mcp, resolve, logger)
-    register_app_tools(mcp, resolve, logger)
-    register_cloud_tools(mcp, resolve, logger)
-    register_property_tools(mcp, resolve, logger)
-
-
-__all__ = [
-    "register_all_tools",
-    "register_core_tools",
-    "register_project_tools",
-    "register_timeline_tools",
-    "register_media_tools",
-    "register_color_tools",
-    "register_delivery_tools",
-    "register_cache_tools",
-    "register_timeline_item_tools",
-    "register_keyframe_tools",
-    "register_preset_tools",
-    "register_inspection_tools",
-    "register_layout_tools",
-    "register_app_tools",
-    "register_cloud_tools",
-    "register_property_tools",
-]
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    "register_all_tools": "._registry",
+    "register_core_tools": ".core",
+    "register_project_tools": ".project",
+    "register_timeline_tools": ".timeline",
+    "register_media_tools": ".media",
+    "register_color_tools": ".color",
+    "register_delivery_tools": ".delivery",
+    "register_cache_tools": ".cache",
+    "register_timeline_item_tools": ".timeline_items",
+    "register_keyframe_tools": ".keyframes",
+    "register_preset_tools": ".presets",
+    "register_inspection_tools": ".inspection",
+    "register_layout_tools": ".layout",
+    "register_app_tools": ".app",
+    "register_cloud_tools": ".cloud",
+    "register_property_tools": ".properties",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+__all__ = list(_LAZY_ATTRS)
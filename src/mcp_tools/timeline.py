@@ -129,6 +129,38 @@ def register_timeline_tools(mcp, resolve, logger):
             audio_tracks,
         )
 
+    @mcp.tool()
+    def create_and_get_timeline(
+        name: str,
+        frame_rate: str = None,
+        resolution_width: int = None,
+        resolution_height: int = None,
+        start_timecode: str = None,
+        video_tracks: int = None,
+        audio_tracks: int = None,
+    ) -> Dict[str, Any]:
+        """Create a timeline with custom settings and return its info in one call."""
+        from src.api.timeline_operations import (
+            create_empty_timeline as create_empty_timeline_func,
+            get_current_timeline_info,
+        )
+
+        message = create_empty_timeline_func(
+            resolve,
+            name,
+            frame_rate,
+            resolution_width,
+            resolution_height,
+            start_timecode,
+            video_tracks,
+            audio_tracks,
+        )
+        if not message.startswith("Successfully"):
+            return {"error": message}
+
+        # create_empty_timeline already makes the new timeline current
+        return get_current_timeline_info(resolve)
+
     @mcp.tool()
     def delete_timeline(name: str) -> str:
         """Delete a timeline by name."""
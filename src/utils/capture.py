@@ -9,6 +9,7 @@ import os
 import sys
 import subprocess
 import base64
+import functools
 from datetime import datetime
 from typing import Optional, Dict, Any
 
@@ -16,8 +17,9 @@ from typing import Optional, Dict, Any
 DEFAULT_OUTPUT_DIR = os.path.expanduser("~/.scitex/capture")
 
 
+@functools.lru_cache(maxsize=1)
 def is_wsl() -> bool:
-    """Check if running in WSL."""
+    """Check if running in WSL (cached; the platform cannot change at runtime)."""
     return sys.platform == "linux" and "microsoft" in os.uname().release.lower()
 
 
@@ -8,11 +8,21 @@ import time
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional
 
 from .capture import capture_screenshot, DEFAULT_OUTPUT_DIR
 
 
+class CaptureStatus(NamedTuple):
+    """Snapshot of a ContinuousCapture session."""
+
+    running: bool
+    session_id: Optional[str]
+    screenshot_count: int
+    output_dir: str
+    interval_sec: float
+
+
 class ContinuousCapture:
     """Continuous screenshot capture for monitoring."""
 
@@ -78,15 +88,15 @@ class ContinuousCapture:
             sleep_time = max(0.01, self.interval_sec - elapsed)
             time.sleep(sleep_time)
 
-    def get_status(self) -> Dict[str, Any]:
+    def get_status(self) -> CaptureStatus:
         """Get capture status."""
-        return {
-            "running": self.running,
-            "session_id": self.session_id,
-            "screenshot_count": self.screenshot_count,
-            "output_dir": str(self.output_dir),
-            "interval_sec": self.interval_sec,
-        }
+        return CaptureStatus(
+            self.running,
+            self.session_id,
+            self.screenshot_count,
+            str(self.output_dir),
+            self.interval_sec,
+        )
 
 
 # Global instance for MCP tools
@@ -137,7 +147,7 @@ def stop_monitoring() -> Dict[str, Any]:
     return {
         "success": True,
         "message": "Monitoring stopped",
-        "screenshots_captured": status["screenshot_count"],
+        "screenshots_captured": status.screenshot_count,
     }
 
 
@@ -146,4 +156,4 @@ def get_monitoring_status() -> Dict[str, Any]:
     if not _capture_instance:
         return {"running": False, "message": "No active monitoring session"}
 
-    return _capture_instance.get_status()
+    return _capture_instance.get_status()._asdict()
@@ -0,0 +1,6 @@
+"""Shared pytest configuration for the test suite."""
+
+# Standalone scripts that drive a live MCP server; run them directly instead
+# (see `make test-live`). Collecting them would open their log files on every
+# xdist worker.
+collect_ignore = ["test_improvements.py", "test_custom_timeline.py"]
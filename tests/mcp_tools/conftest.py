@@ -0,0 +1,31 @@
+"""Shared fixtures for MCP tools tests."""
+
+import importlib
+import sys
+
+import pytest
+
+from .tool_modules import TOOL_MODULES
+
+
+def _resolve(path, name, _modules=sys.modules):
+    """Look up ``name`` in module ``path`` with a single sys.modules probe."""
+    module = _modules.get(path) or importlib.import_module(path)
+    try:
+        return module.__dict__[name]
+    except KeyError:
+        # Lazily exported names (PEP 562 __getattr__) are not in __dict__ yet
+        return getattr(module, name)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prewarm_mcp_tools():
+    """Import every tool module once so later imports hit sys.modules."""
+    for path, _ in TOOL_MODULES:
+        importlib.import_module(path)
+
+
+@pytest.fixture(scope="session")
+def registered_funcs():
+    """Resolve every registration function once per session, keyed by name."""
+    return {name: _resolve(path, name) for path, name in TOOL_MODULES}
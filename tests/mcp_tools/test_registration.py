@@ -1,66 +1,90 @@
 """Tests for MCP tools registration functions."""
 
 import pytest
-from unittest.mock import Mock, MagicMock
-
-
-# Parametrized test for all module imports
-TOOL_MODULES = [
-    ("src.mcp_tools", "register_all_tools"),
-    ("src.mcp_tools.core", "register_core_tools"),
-    ("src.mcp_tools.project", "register_project_tools"),
-    ("src.mcp_tools.timeline", "register_timeline_tools"),
-    ("src.mcp_tools.media", "register_media_tools"),
-    ("src.mcp_tools.color", "register_color_tools"),
-    ("src.mcp_tools.delivery", "register_delivery_tools"),
-    ("src.mcp_tools.cache", "register_cache_tools"),
-    ("src.mcp_tools.keyframes", "register_keyframe_tools"),
-    ("src.mcp_tools.presets", "register_preset_tools"),
-    ("src.mcp_tools.inspection", "register_inspection_tools"),
-    ("src.mcp_tools.layout", "register_layout_tools"),
-    ("src.mcp_tools.app", "register_app_tools"),
-    ("src.mcp_tools.cloud", "register_cloud_tools"),
-    ("src.mcp_tools.properties", "register_property_tools"),
-    ("src.mcp_tools.timeline_items", "register_timeline_item_tools"),
-]
+from unittest.mock import Mock
+
+from .tool_modules import TOOL_MODULES
+
+TOOL_FUNC_NAMES = [name for _, name in TOOL_MODULES]
+# Per-module registration functions (everything except register_all_tools)
+REGISTRATION_FUNC_NAMES = TOOL_FUNC_NAMES[1:]
+# Subset exercised against a null resolve
+NULL_RESOLVE_FUNC_NAMES = REGISTRATION_FUNC_NAMES[:6]
+
+VALID_PAGES = ("media", "cut", "edit", "fusion", "color", "fairlight", "deliver")
+
+
+def make_tool_capture():
+    """Return a (registry, mcp.tool replacement) pair keyed by function name."""
+    registered_tools = {}
+
+    def capture_tool():
+        def decorator(func):
+            registered_tools[func.__name__] = func
+            return func
+
+        return decorator
+
+    return registered_tools, capture_tool
+
+
+def make_resource_capture():
+    """Return a (registry, mcp.resource replacement) pair keyed by URI."""
+    registered_resources = {}
+
+    def capture_resource(uri):
+        def decorator(func):
+            registered_resources[uri] = func
+            return func
+
+        return decorator
+
+    return registered_resources, capture_resource
+
+
+@pytest.fixture
+def mocks():
+    """Provide fresh (mcp, resolve, logger) doubles for a registration call."""
+    return Mock(), Mock(), Mock()
 
 
 class TestModuleImports:
     """Tests that all MCP tool modules can be imported."""
 
-    @pytest.mark.parametrize("module_path,func_name", TOOL_MODULES)
-    def test_module_imports_and_is_callable(self, module_path, func_name):
+    @pytest.mark.parametrize("func_name", TOOL_FUNC_NAMES)
+    def test_module_imports_and_is_callable(self, func_name, registered_funcs):
         """Should import module and verify function is callable."""
-        import importlib
-
-        module = importlib.import_module(module_path)
-        func = getattr(module, func_name)
-        assert callable(func)
+        assert callable(registered_funcs[func_name])
 
 
 class TestRegisterAllTools:
     """Tests for register_all_tools function."""
 
-    def test_registers_all_tool_modules(self):
+    def test_registers_all_tool_modules(self, mocks):
         """Should call all registration functions."""
         from src.mcp_tools import register_all_tools
 
-        mcp = MagicMock()
-        resolve = Mock()
-        logger = Mock()
+        mcp, resolve, logger = mocks
+
+        # Count info calls without recording every call on the mock
+        count = 0
+
+        def _tick(*_args, **_kwargs):
+            nonlocal count
+            count += 1
+
+        logger.info = _tick
 
         register_all_tools(mcp, resolve, logger)
 
         # Should log for each module (15 modules)
-        assert logger.info.call_count >= 15
+        assert count >= 15
 
-    def test_mcp_decorators_are_called(self):
+    def test_mcp_decorators_are_called(self, mocks):
         """Should use mcp.tool and mcp.resource decorators."""
         from src.mcp_tools import register_all_tools
 
-        mcp = MagicMock()
-        resolve = Mock()
-        logger = Mock()
+        mcp, resolve, logger = mocks
 
         register_all_tools(mcp, resolve, logger)
 
@@ -71,25 +95,13 @@ class TestRegisterAllTools:
 class TestCoreTools:
     """Tests for core tools functionality."""
 
-    def test_switch_page_rejects_invalid_page(self):
+    def test_switch_page_rejects_invalid_page(self, mocks):
         """Should return error for invalid page name."""
         from src.mcp_tools.core import register_core_tools
 
-        mcp = MagicMock()
-        resolve = Mock()
-        logger = Mock()
+        mcp, resolve, logger = mocks
 
-        # Capture the registered tool
-        registered_tools = {}
-
-        def capture_tool():
-            def decorator(func):
-                registered_tools[func.__name__] = func
-                return func
-
-            return decorator
-
-        mcp.tool = capture_tool
+        registered_tools, mcp.tool = make_tool_capture()
 
         register_core_tools(mcp, resolve, logger)
 
@@ -98,59 +110,30 @@ class TestCoreTools:
         assert "Error" in result
         assert "Invalid page name" in result
 
-    def test_switch_page_accepts_valid_pages(self):
+    def test_switch_page_accepts_valid_pages(self, mocks):
         """Should accept all valid page names."""
         from src.mcp_tools.core import register_core_tools
 
-        mcp = MagicMock()
-        resolve = Mock()
+        mcp, resolve, logger = mocks
         resolve.OpenPage.return_value = True
-        logger = Mock()
-
-        registered_tools = {}
-
-        def capture_tool():
-            def decorator(func):
-                registered_tools[func.__name__] = func
-                return func
 
-            return decorator
-
-        mcp.tool = capture_tool
+        registered_tools, mcp.tool = make_tool_capture()
 
         register_core_tools(mcp, resolve, logger)
 
-        valid_pages = [
-            "media",
-            "cut",
-            "edit",
-            "fusion",
-            "color",
-            "fairlight",
-            "deliver",
-        ]
-        for page in valid_pages:
-            result = registered_tools["switch_page"](page)
+        switch_page = registered_tools["switch_page"]
+        for page in VALID_PAGES:
+            result = switch_page(page)
             assert "Successfully" in result or "switched" in result.lower()
 
-    def test_switch_page_returns_error_when_not_connected(self):
+    def test_switch_page_returns_error_when_not_connected(self, mocks):
         """Should return error when resolve is None."""
         from src.mcp_tools.core import register_core_tools
 
-        mcp = MagicMock()
+        mcp, _, logger = mocks
         resolve = None
-        logger = Mock()
-
-        registered_tools = {}
-
-        def capture_tool():
-            def decorator(func):
-                registered_tools[func.__name__] = func
-                return func
-
-            return decorator
 
-        mcp.tool = capture_tool
+        registered_tools, mcp.tool = make_tool_capture()
 
         register_core_tools(mcp, resolve, logger)
 
@@ -162,24 +145,14 @@ class TestCoreTools:
 class TestCoreResources:
     """Tests for core resource functionality."""
 
-    def test_get_version_returns_error_when_not_connected(self):
+    def test_get_version_returns_error_when_not_connected(self, mocks):
         """Should return error when resolve is None."""
         from src.mcp_tools.core import register_core_tools
 
-        mcp = MagicMock()
+        mcp, _, logger = mocks
         resolve = None
-        logger = Mock()
 
-        registered_resources = {}
-
-        def capture_resource(uri):
-            def decorator(func):
-                registered_resources[uri] = func
-                return func
-
-            return decorator
-
-        mcp.resource = capture_resource
+        registered_resources, mcp.resource = make_resource_capture()
 
         register_core_tools(mcp, resolve, logger)
 
@@ -187,26 +160,15 @@ class TestCoreResources:
         assert "Error" in result
         assert "Not connected" in result
 
-    def test_get_version_returns_product_info(self):
+    def test_get_version_returns_product_info(self, mocks):
         """Should return product name and version."""
         from src.mcp_tools.core import register_core_tools
 
-        mcp = MagicMock()
-        resolve = Mock()
+        mcp, resolve, logger = mocks
         resolve.GetProductName.return_value = "DaVinci Resolve"
         resolve.GetVersionString.return_value = "18.5.1"
-        logger = Mock()
-
-        registered_resources = {}
-
-        def capture_resource(uri):
-            def decorator(func):
-                registered_resources[uri] = func
-                return func
 
-            return decorator
-
-        mcp.resource = capture_resource
+        registered_resources, mcp.resource = make_resource_capture()
 
         register_core_tools(mcp, resolve, logger)
 
@@ -218,24 +180,13 @@ class TestCoreResources:
 class TestProjectTools:
     """Tests for project tools functionality."""
 
-    def test_open_project_rejects_empty_name(self):
+    def test_open_project_rejects_empty_name(self, mocks):
         """Should return error for empty project name."""
         from src.mcp_tools.project import register_project_tools
 
-        mcp = MagicMock()
-        resolve = Mock()
-        logger = Mock()
-
-        registered_tools = {}
-
-        def capture_tool():
-            def decorator(func):
-                registered_tools[func.__name__] = func
-                return func
-
-            return decorator
+        mcp, resolve, logger = mocks
 
-        mcp.tool = capture_tool
+        registered_tools, mcp.tool = make_tool_capture()
 
         register_project_tools(mcp, resolve, logger)
 
@@ -243,30 +194,19 @@ class TestProjectTools:
         assert "Error" in result
         assert "empty" in result.lower()
 
-    def test_open_project_rejects_nonexistent_project(self):
+    def test_open_project_rejects_nonexistent_project(self, mocks):
         """Should return error when project doesn't exist."""
         from src.mcp_tools.project import register_project_tools
 
-        mcp = MagicMock()
-        resolve = Mock()
+        mcp, resolve, logger = mocks
         project_manager = Mock()
         project_manager.GetProjectListInCurrentFolder.return_value = [
             "Project1",
             "Project2",
         ]
         resolve.GetProjectManager.return_value = project_manager
-        logger = Mock()
 
-        registered_tools = {}
-
-        def capture_tool():
-            def decorator(func):
-                registered_tools[func.__name__] = func
-                return func
-
-            return decorator
-
-        mcp.tool = capture_tool
+        registered_tools, mcp.tool = make_tool_capture()
 
         register_project_tools(mcp, resolve, logger)
 
@@ -275,27 +215,16 @@ class TestProjectTools:
         assert "not found" in result.lower()
         assert "Project1" in result  # Should list available projects
 
-    def test_create_project_rejects_duplicate_name(self):
+    def test_create_project_rejects_duplicate_name(self, mocks):
         """Should return error when project already exists."""
         from src.mcp_tools.project import register_project_tools
 
-        mcp = MagicMock()
-        resolve = Mock()
+        mcp, resolve, logger = mocks
         project_manager = Mock()
         project_manager.GetProjectListInCurrentFolder.return_value = ["ExistingProject"]
         resolve.GetProjectManager.return_value = project_manager
-        logger = Mock()
-
-        registered_tools = {}
-
-        def capture_tool():
-            def decorator(func):
-                registered_tools[func.__name__] = func
-                return func
 
-            return decorator
-
-        mcp.tool = capture_tool
+        registered_tools, mcp.tool = make_tool_capture()
 
         register_project_tools(mcp, resolve, logger)
 
@@ -303,27 +232,16 @@ class TestProjectTools:
         assert "Error" in result
         assert "already exists" in result
 
-    def test_save_project_returns_error_when_no_project_open(self):
+    def test_save_project_returns_error_when_no_project_open(self, mocks):
         """Should return error when no project is open."""
         from src.mcp_tools.project import register_project_tools
 
-        mcp = MagicMock()
-        resolve = Mock()
+        mcp, resolve, logger = mocks
         project_manager = Mock()
         project_manager.GetCurrentProject.return_value = None
         resolve.GetProjectManager.return_value = project_manager
-        logger = Mock()
-
-        registered_tools = {}
-
-        def capture_tool():
-            def decorator(func):
-                registered_tools[func.__name__] = func
-                return func
 
-            return decorator
-
-        mcp.tool = capture_tool
+        registered_tools, mcp.tool = make_tool_capture()
 
         register_project_tools(mcp, resolve, logger)
 
@@ -335,12 +253,11 @@ class TestProjectTools:
 class TestProjectResources:
     """Tests for project resource functionality."""
 
-    def test_list_projects_returns_project_list(self):
+    def test_list_projects_returns_project_list(self, mocks):
         """Should return list of projects."""
         from src.mcp_tools.project import register_project_tools
 
-        mcp = MagicMock()
-        resolve = Mock()
+        mcp, resolve, logger = mocks
         project_manager = Mock()
         project_manager.GetProjectListInCurrentFolder.return_value = [
             "Project1",
@@ -348,18 +265,8 @@ class TestProjectResources:
             "Project3",
         ]
         resolve.GetProjectManager.return_value = project_manager
-        logger = Mock()
-
-        registered_resources = {}
 
-        def capture_resource(uri):
-            def decorator(func):
-                registered_resources[uri] = func
-                return func
-
-            return decorator
-
-        mcp.resource = capture_resource
+        registered_resources, mcp.resource = make_resource_capture()
 
         register_project_tools(mcp, resolve, logger)
 
@@ -368,29 +275,18 @@ class TestProjectResources:
         assert len(result) == 3
         assert "Project1" in result
 
-    def test_get_current_project_returns_name(self):
+    def test_get_current_project_returns_name(self, mocks):
         """Should return current project name."""
         from src.mcp_tools.project import register_project_tools
 
-        mcp = MagicMock()
-        resolve = Mock()
+        mcp, resolve, logger = mocks
         project_manager = Mock()
         current_project = Mock()
         current_project.GetName.return_value = "MyProject"
         project_manager.GetCurrentProject.return_value = current_project
         resolve.GetProjectManager.return_value = project_manager
-        logger = Mock()
-
-        registered_resources = {}
-
-        def capture_resource(uri):
-            def decorator(func):
-                registered_resources[uri] = func
-                return func
-
-            return decorator
 
-        mcp.resource = capture_resource
+        registered_resources, mcp.resource = make_resource_capture()
 
         register_project_tools(mcp, resolve, logger)
 
@@ -398,103 +294,60 @@ class TestProjectResources:
         assert result == "MyProject"
 
 
-class TestToolRegistrationModules:
-    """Parametrized tests for all tool registration modules."""
+class TestTimelineTools:
+    """Tests for timeline tools functionality."""
 
-    @pytest.mark.parametrize(
-        "module_path,func_name",
-        [
-            ("src.mcp_tools.core", "register_core_tools"),
-            ("src.mcp_tools.project", "register_project_tools"),
-            ("src.mcp_tools.timeline", "register_timeline_tools"),
-            ("src.mcp_tools.media", "register_media_tools"),
-            ("src.mcp_tools.color", "register_color_tools"),
-            ("src.mcp_tools.delivery", "register_delivery_tools"),
-            ("src.mcp_tools.cache", "register_cache_tools"),
-            ("src.mcp_tools.keyframes", "register_keyframe_tools"),
-            ("src.mcp_tools.presets", "register_preset_tools"),
-            ("src.mcp_tools.inspection", "register_inspection_tools"),
-            ("src.mcp_tools.layout", "register_layout_tools"),
-            ("src.mcp_tools.app", "register_app_tools"),
-            ("src.mcp_tools.cloud", "register_cloud_tools"),
-            ("src.mcp_tools.properties", "register_property_tools"),
-            ("src.mcp_tools.timeline_items", "register_timeline_item_tools"),
-        ],
-    )
-    def test_registration_does_not_raise(self, module_path, func_name):
-        """Should register without raising exceptions."""
-        import importlib
-
-        module = importlib.import_module(module_path)
-        register_func = getattr(module, func_name)
-
-        mcp = MagicMock()
-        resolve = Mock()
-        logger = Mock()
+    def test_create_and_get_timeline_returns_error_when_not_connected(self, mocks):
+        """Should return error dict when resolve is None."""
+        from src.mcp_tools.timeline import register_timeline_tools
 
-        # Should not raise
-        register_func(mcp, resolve, logger)
+        mcp, _, logger = mocks
+        resolve = None
 
-    @pytest.mark.parametrize(
-        "module_path,func_name",
-        [
-            ("src.mcp_tools.core", "register_core_tools"),
-            ("src.mcp_tools.project", "register_project_tools"),
-            ("src.mcp_tools.timeline", "register_timeline_tools"),
-            ("src.mcp_tools.media", "register_media_tools"),
-            ("src.mcp_tools.color", "register_color_tools"),
-            ("src.mcp_tools.delivery", "register_delivery_tools"),
-            ("src.mcp_tools.cache", "register_cache_tools"),
-            ("src.mcp_tools.keyframes", "register_keyframe_tools"),
-            ("src.mcp_tools.presets", "register_preset_tools"),
-            ("src.mcp_tools.inspection", "register_inspection_tools"),
-            ("src.mcp_tools.layout", "register_layout_tools"),
-            ("src.mcp_tools.app", "register_app_tools"),
-            ("src.mcp_tools.cloud", "register_cloud_tools"),
-            ("src.mcp_tools.properties", "register_property_tools"),
-            ("src.mcp_tools.timeline_items", "register_timeline_item_tools"),
-        ],
-    )
-    def test_registration_logs_info(self, module_path, func_name):
-        """Should log info message after registration."""
-        import importlib
-
-        module = importlib.import_module(module_path)
-        register_func = getattr(module, func_name)
-
-        mcp = MagicMock()
-        resolve = Mock()
-        logger = Mock()
+        registered_tools, mcp.tool = make_tool_capture()
 
-        register_func(mcp, resolve, logger)
+        register_timeline_tools(mcp, resolve, logger)
 
-        # Should log at least one info message
-        assert logger.info.called
+        result = registered_tools["create_and_get_timeline"]("New Timeline")
+        assert "Not connected" in result["error"]
+
+    def test_create_and_get_timeline_returns_new_timeline_info(self, mocks):
+        """Should create the timeline and return its info in one call."""
+        from src.mcp_tools.timeline import register_timeline_tools
+
+        mcp, resolve, logger = mocks
+        project = Mock()
+        project.GetTimelineCount.return_value = 0
+        timeline = Mock()
+        timeline.GetName.return_value = "New Timeline"
+        project.GetMediaPool.return_value.CreateEmptyTimeline.return_value = timeline
+        project.GetCurrentTimeline.return_value = timeline
+        resolve.GetProjectManager.return_value.GetCurrentProject.return_value = project
+
+        registered_tools, mcp.tool = make_tool_capture()
+
+        register_timeline_tools(mcp, resolve, logger)
+
+        result = registered_tools["create_and_get_timeline"]("New Timeline")
+        assert result["name"] == "New Timeline"
+        project.SetCurrentTimeline.assert_called_once_with(timeline)
 
-    @pytest.mark.parametrize(
-        "module_path,func_name",
-        [
-            ("src.mcp_tools.core", "register_core_tools"),
-            ("src.mcp_tools.project", "register_project_tools"),
-            ("src.mcp_tools.timeline", "register_timeline_tools"),
-            ("src.mcp_tools.media", "register_media_tools"),
-            ("src.mcp_tools.color", "register_color_tools"),
-            ("src.mcp_tools.delivery", "register_delivery_tools"),
-        ],
-    )
-    def test_registration_uses_mcp_decorators(self, module_path, func_name):
-        """Should use mcp.tool or mcp.resource decorators."""
-        import importlib
-
-        module = importlib.import_module(module_path)
-        register_func = getattr(module, func_name)
-
-        mcp = MagicMock()
-        resolve = Mock()
-        logger = Mock()
 
+class TestToolRegistrationModules:
+    """Parametrized tests for all tool registration modules."""
+
+    @pytest.mark.parametrize("func_name", REGISTRATION_FUNC_NAMES)
+    def test_registration_contract(self, func_name, registered_funcs, mocks):
+        """Should register without raising, log info and use mcp decorators."""
+        register_func = registered_funcs[func_name]
+
+        mcp, resolve, logger = mocks
+
+        # Should not raise
         register_func(mcp, resolve, logger)
 
+        # Should log at least one info message
+        assert logger.info.called
         # At least one decorator should be called
         assert mcp.tool.called or mcp.resource.called
 
@@ -502,27 +355,15 @@ class TestToolRegistrationModules:
 class TestNullResolveHandling:
     """Tests that tools handle null resolve gracefully."""
 
-    @pytest.mark.parametrize(
-        "module_path,func_name",
-        [
-            ("src.mcp_tools.core", "register_core_tools"),
-            ("src.mcp_tools.project", "register_project_tools"),
-            ("src.mcp_tools.timeline", "register_timeline_tools"),
-            ("src.mcp_tools.media", "register_media_tools"),
-            ("src.mcp_tools.color", "register_color_tools"),
-            ("src.mcp_tools.delivery", "register_delivery_tools"),
-        ],
-    )
-    def test_registration_works_with_null_resolve(self, module_path, func_name):
+    @pytest.mark.parametrize("func_name", NULL_RESOLVE_FUNC_NAMES)
+    def test_registration_works_with_null_resolve(
+        self, func_name, registered_funcs, mocks
+    ):
         """Should register successfully even with null resolve."""
-        import importlib
-
-        module = importlib.import_module(module_path)
-        register_func = getattr(module, func_name)
+        register_func = registered_funcs[func_name]
 
-        mcp = MagicMock()
+        mcp, _, logger = mocks
         resolve = None  # Null resolve
-        logger = Mock()
 
         # Should not raise
         register_func(mcp, resolve, logger)
@@ -0,0 +1,21 @@
+"""MCP tool modules shared by the conftest fixtures and the registration tests."""
+
+# (module path, registration function) for every MCP tool module
+TOOL_MODULES = [
+    ("src.mcp_tools", "register_all_tools"),
+    ("src.mcp_tools.core", "register_core_tools"),
+    ("src.mcp_tools.project", "register_project_tools"),
+    ("src.mcp_tools.timeline", "register_timeline_tools"),
+    ("src.mcp_tools.media", "register_media_tools"),
+    ("src.mcp_tools.color", "register_color_tools"),
+    ("src.mcp_tools.delivery", "register_delivery_tools"),
+    ("src.mcp_tools.cache", "register_cache_tools"),
+    ("src.mcp_tools.keyframes", "register_keyframe_tools"),
+    ("src.mcp_tools.presets", "register_preset_tools"),
+    ("src.mcp_tools.inspection", "register_inspection_tools"),
+    ("src.mcp_tools.layout", "register_layout_tools"),
+    ("src.mcp_tools.app", "register_app_tools"),
+    ("src.mcp_tools.cloud", "register_cloud_tools"),
+    ("src.mcp_tools.properties", "register_property_tools"),
+    ("src.mcp_tools.timeline_items", "register_timeline_item_tools"),
+]
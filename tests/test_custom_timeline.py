@@ -15,32 +15,114 @@ Requirements:
 
 import sys
 import time
+import atexit
+import json
 import requests
 import logging
+import logging.handlers
+import queue
 from typing import Dict, Any
-
-# Configure logging
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+# Configure logging; file/console writes happen on a background listener thread
+_log_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+_log_handlers = [
+    logging.FileHandler("custom_timeline_test.log"),
+    logging.StreamHandler(),
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.Queue(-1)
+# The listener's handlers apply the real format; the queue only carries the message
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("custom_timeline_test.log"), logging.StreamHandler()],
+    format="%(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Server configuration
 SERVER_URL = "http://localhost:8000/api"
+# (connect, read) timeouts in seconds so a hung server fails fast
+REQUEST_TIMEOUT = (2.0, 15.0)
+
+# Reuse one keep-alive connection pool for every request
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://",
+    requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0),
+)
+atexit.register(_SESSION.close)
+
+# URL parsing and header merging are done once; each call only swaps the body
+_REQ_TEMPLATE = _SESSION.prepare_request(
+    requests.Request("POST", SERVER_URL, headers={"Content-Type": "application/json"})
+)
+
+# Only failures to open the connection are retried, with a short exponential
+# backoff. A dropped or reset connection after the body went out, or a read
+# timeout, is not: the server may already have run the (state-changing) call.
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.05
+RETRY_MAX_DELAY = 0.4
+
+
+def _never_sent(exc: requests.RequestException) -> bool:
+    """Return True if the request failed before a connection was established."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    reason = exc.args[0] if exc.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, NewConnectionError)
+
+
+def _post(payload: bytes) -> requests.Response:
+    """Send a payload, retrying only when it never reached the server."""
+    req = _REQ_TEMPLATE.copy()
+    req.prepare_body(payload, None)
+    for attempt in range(RETRY_ATTEMPTS):
+        try:
+            return _SESSION.send(req, timeout=REQUEST_TIMEOUT)
+        except requests.ConnectionError as e:
+            if not _never_sent(e) or attempt == RETRY_ATTEMPTS - 1:
+                raise
+            time.sleep(min(RETRY_BASE_DELAY * 2**attempt, RETRY_MAX_DELAY))
 
 
 def send_request(tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """Send a request to the MCP server."""
+    logger.info("Sending request: %s with params %s", tool_name, params)
+    payload = _dumps({"tool": tool_name, "params": params})
     try:
-        payload = {"tool": tool_name, "params": params}
-        logger.info(f"Sending request: {tool_name} with params {params}")
-        response = requests.post(SERVER_URL, json=payload)
+        start = time.monotonic()
+        response = _post(payload)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
+    except requests.exceptions.Timeout:
+        elapsed = time.monotonic() - start
+        logger.error("Request timed out after %.2fs: %s", elapsed, tool_name)
+        return {"success": False, "error": "timeout", "elapsed": elapsed}
     except requests.exceptions.RequestException as e:
-        logger.error(f"Request error: {e}")
+        logger.error("Request error: %s", e)
+        return {"success": False, "error": str(e)}
+    except ValueError as e:
+        logger.error("Invalid JSON response: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -55,10 +137,10 @@ def test_basic_timeline_creation():
     )
 
     if "error" in result and result.get("error"):
-        logger.error(f"❌ Basic timeline creation failed: {result.get('error')}")
+        logger.error("❌ Basic timeline creation failed: %s", result.get("error"))
         return False
     else:
-        logger.info(f"✅ Basic timeline created: {timeline_name}")
+        logger.info("✅ Basic timeline created: %s", timeline_name)
         return True
 
 
@@ -76,42 +158,24 @@ def test_custom_timeline_creation():
         "start_timecode": "01:00:00:00",
     }
 
-    result = send_request("mcp_davinci_resolve_create_empty_timeline", params)
+    # Create, switch and fetch info in a single round trip
+    get_timeline_result = send_request(
+        "mcp_davinci_resolve_create_and_get_timeline", params
+    )
 
-    if "error" in result and result.get("error"):
-        logger.error(f"❌ Custom timeline creation failed: {result.get('error')}")
+    if "error" in get_timeline_result or not isinstance(get_timeline_result, dict):
+        logger.error("❌ Custom timeline creation failed: %s", get_timeline_result)
         return False
     else:
-        logger.info(f"✅ Custom timeline created with parameters: {params}")
-
-        # Verify the timeline settings
-        logger.info("Retrieving timeline info to verify settings...")
-
-        # Switch to the created timeline
-        switch_result = send_request(
-            "mcp_davinci_resolve_set_current_timeline", {"name": timeline_name}
-        )
-        if "error" in switch_result and switch_result.get("error"):
-            logger.error(
-                f"❌ Failed to switch to timeline: {switch_result.get('error')}"
-            )
-            return False
-
-        # Get timeline info
-        get_timeline_result = send_request(
-            "mcp_davinci_resolve_get_current_timeline", {}
-        )
-        if "error" in get_timeline_result or not isinstance(get_timeline_result, dict):
-            logger.error(f"❌ Failed to get timeline info: {get_timeline_result}")
-            return False
+        logger.info("✅ Custom timeline created with parameters: %s", params)
 
         # Verify settings
         resolution = get_timeline_result.get("resolution", {})
 
-        logger.info(f"Timeline info: {get_timeline_result}")
-        logger.info(f"Resolution: {resolution}")
-        logger.info(f"Framerate: {get_timeline_result.get('framerate')}")
-        logger.info(f"Start timecode: {get_timeline_result.get('start_timecode')}")
+        logger.info("Timeline info: %s", get_timeline_result)
+        logger.info("Resolution: %s", resolution)
+        logger.info("Framerate: %s", get_timeline_result.get("framerate"))
+        logger.info("Start timecode: %s", get_timeline_result.get("start_timecode"))
 
         return True
 
@@ -128,10 +192,10 @@ def main():
     # Summary
     logger.info("=" * 60)
     logger.info(
-        f"Basic timeline creation: {'✅ PASSED' if basic_result else '❌ FAILED'}"
+        "Basic timeline creation: %s", "✅ PASSED" if basic_result else "❌ FAILED"
     )
     logger.info(
-        f"Custom timeline creation: {'✅ PASSED' if custom_result else '❌ FAILED'}"
+        "Custom timeline creation: %s", "✅ PASSED" if custom_result else "❌ FAILED"
     )
     logger.info("=" * 60)
 
@@ -16,34 +16,218 @@ Requirements:
 
 import time
 import sys
+import atexit
+import json
 import requests
 import logging
-from typing import Dict, Any
-
-# Configure logging
+import logging.handlers
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+# Configure logging; file/console writes happen on a background listener thread
+_log_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+_log_handlers = [logging.FileHandler("mcp_test_results.log"), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.Queue(-1)
+# The listener's handlers apply the real format; the queue only carries the message
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("mcp_test_results.log"), logging.StreamHandler()],
+    format="%(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Server configuration
 SERVER_URL = "http://localhost:8000/api"
+# (connect, read) timeouts in seconds so a hung server fails fast
+REQUEST_TIMEOUT = (2.0, 15.0)
+
+# Reuse one keep-alive connection pool for every request
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://",
+    requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0),
+)
+atexit.register(_SESSION.close)
 
+# URL parsing and header merging are done once; each call only swaps the body
+_REQ_TEMPLATE = _SESSION.prepare_request(
+    requests.Request("POST", SERVER_URL, headers={"Content-Type": "application/json"})
+)
 
-def send_request(tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
-    """Send a request to the MCP server."""
+# Constant payloads are serialized once rather than on every call
+_CLEAR_RENDER_QUEUE_PAYLOAD = _dumps(
+    {
+        "tool": "mcp_davinci_resolve_clear_render_queue",
+        "params": {"random_string": "test"},
+    }
+)
+
+# Only failures to open the connection are retried, with a short exponential
+# backoff. A dropped or reset connection after the body went out, or a read
+# timeout, is not: the server may already have run the (state-changing) call.
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.05
+RETRY_MAX_DELAY = 0.4
+
+
+def _never_sent(exc: requests.RequestException) -> bool:
+    """Return True if the request failed before a connection was established."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    reason = exc.args[0] if exc.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, NewConnectionError)
+
+
+def _post(payload: bytes) -> requests.Response:
+    """Send a payload, retrying only when it never reached the server."""
+    req = _REQ_TEMPLATE.copy()
+    req.prepare_body(payload, None)
+    for attempt in range(RETRY_ATTEMPTS):
+        try:
+            return _SESSION.send(req, timeout=REQUEST_TIMEOUT)
+        except requests.ConnectionError as e:
+            if not _never_sent(e) or attempt == RETRY_ATTEMPTS - 1:
+                raise
+            time.sleep(min(RETRY_BASE_DELAY * 2**attempt, RETRY_MAX_DELAY))
+
+
+# Circuit breaker: after repeated connection failures or timeouts, stop hitting
+# a down or hung server. Requests are sent from thread pools, so the state is
+# only touched under the lock.
+CIRCUIT_FAIL_THRESHOLD = 3
+CIRCUIT_OPEN_SECONDS = 5.0
+_CIRCUIT_LOCK = threading.Lock()
+_FAIL_COUNT = 0
+_CIRCUIT_OPEN_UNTIL = 0.0
+
+
+def _circuit_open() -> bool:
+    with _CIRCUIT_LOCK:
+        return time.monotonic() < _CIRCUIT_OPEN_UNTIL
+
+
+def _record_success() -> None:
+    global _FAIL_COUNT
+    with _CIRCUIT_LOCK:
+        _FAIL_COUNT = 0
+
+
+def _record_failure() -> bool:
+    """Count a failed request; return True if this opened the circuit."""
+    global _FAIL_COUNT, _CIRCUIT_OPEN_UNTIL
+    with _CIRCUIT_LOCK:
+        _FAIL_COUNT += 1
+        if _FAIL_COUNT < CIRCUIT_FAIL_THRESHOLD:
+            return False
+        _FAIL_COUNT = 0
+        _CIRCUIT_OPEN_UNTIL = time.monotonic() + CIRCUIT_OPEN_SECONDS
+        return True
+
+
+def send_request_raw(payload: bytes, tool_name: str = "") -> Dict[str, Any]:
+    """Send an already serialized JSON payload to the MCP server."""
+    if _circuit_open():
+        return {"success": False, "error": "circuit-open"}
     try:
-        payload = {"tool": tool_name, "params": params}
-        response = requests.post(SERVER_URL, json=payload)
+        start = time.monotonic()
+        response = _post(payload)
+        _record_success()
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
+    except requests.exceptions.Timeout:
+        # Also catches ConnectTimeout, which subclasses ConnectionError too
+        elapsed = time.monotonic() - start
+        logger.error("Request timed out after %.2fs: %s", elapsed, tool_name)
+        if _record_failure():
+            logger.error("Circuit open for %.1fs", CIRCUIT_OPEN_SECONDS)
+        return {"success": False, "error": "timeout", "elapsed": elapsed}
+    except requests.exceptions.ConnectionError as e:
+        logger.error("Connection error: %s", e)
+        if _record_failure():
+            logger.error("Circuit open for %.1fs", CIRCUIT_OPEN_SECONDS)
+        return {"success": False, "error": str(e)}
     except requests.exceptions.RequestException as e:
-        logger.error(f"Request error: {e}")
+        logger.error("Request error: %s", e)
+        return {"success": False, "error": str(e)}
+    except ValueError as e:
+        logger.error("Invalid JSON response: %s", e)
         return {"success": False, "error": str(e)}
 
 
+def send_request(tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Send a request to the MCP server."""
+    payload = _dumps({"tool": tool_name, "params": params})
+    return send_request_raw(payload, tool_name)
+
+
+def set_project_settings(params_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Send set_project_setting calls, returning results in input order.
+
+    Writes to different setting keys run in parallel; writes to the same key
+    stay sequential in the given order so the final project value is the
+    same as sending them one by one.
+    """
+    by_key: Dict[str, List[int]] = {}
+    for index, params in enumerate(params_list):
+        by_key.setdefault(params["setting_name"], []).append(index)
+
+    results: List[Dict[str, Any]] = [{}] * len(params_list)
+
+    def _send_in_order(indices: List[int]) -> None:
+        for index in indices:
+            results[index] = send_request(
+                "mcp_davinci_resolve_set_project_setting", params_list[index]
+            )
+
+    with ThreadPoolExecutor(max_workers=len(by_key)) as executor:
+        list(executor.map(_send_in_order, by_key.values()))
+    return results
+
+
+# The HTTP API has no tool that reports the current page (it is only exposed
+# as the resolve://current-page MCP resource), so a page switch cannot be
+# polled; give Resolve a fixed moment to finish switching instead.
+PAGE_SWITCH_DELAY = 1.0
+
+
+def _switch_confirmed(result: Dict[str, Any]) -> bool:
+    """Return True only when the server reports that the page switch happened."""
+    content = str(result.get("content", ""))
+    if content:
+        return "Successfully switched" in content
+    return result.get("success") is True
+
+
+def set_page(page: str) -> Dict[str, Any]:
+    """Switch to a page and wait for Resolve only if the switch happened."""
+    result = send_request("mcp_davinci_resolve_switch_page", {"page": page})
+    if _switch_confirmed(result):
+        time.sleep(PAGE_SWITCH_DELAY)
+    return result
+
+
 def test_server_connection() -> bool:
     """Test basic connection to DaVinci Resolve via the server."""
     logger.info("Testing server connection...")
@@ -56,7 +240,7 @@ def test_server_connection() -> bool:
         return True
     else:
         logger.error(
-            f"❌ Server connection failed: {result.get('error', 'Unknown error')}"
+            "❌ Server connection failed: %s", result.get("error", "Unknown error")
         )
         return False
 
@@ -65,26 +249,15 @@ def test_project_settings() -> bool:
     """Test setting project settings with different parameter types."""
     logger.info("Testing project settings parameter handling...")
 
-    # Test with numeric value
-    logger.info("Testing numeric parameter...")
-    result1 = send_request(
-        "mcp_davinci_resolve_set_project_setting",
-        {"setting_name": "timelineFrameRate", "setting_value": 24},
-    )
-
-    # Test with string value
-    logger.info("Testing string parameter...")
-    result2 = send_request(
-        "mcp_davinci_resolve_set_project_setting",
-        {"setting_name": "timelineFrameRate", "setting_value": "24"},
-    )
-
-    # Test with float value
-    logger.info("Testing float parameter...")
-    result3 = send_request(
-        "mcp_davinci_resolve_set_project_setting",
-        {"setting_name": "colorScienceMode", "setting_value": 0},
-    )
+    # The two timelineFrameRate writes run in order; colorScienceMode in parallel
+    cases = [
+        ("numeric", {"setting_name": "timelineFrameRate", "setting_value": 24}),
+        ("string", {"setting_name": "timelineFrameRate", "setting_value": "24"}),
+        ("float", {"setting_name": "colorScienceMode", "setting_value": 0}),
+    ]
+    for label, _ in cases:
+        logger.info("Testing %s parameter...", label)
+    result1, result2, result3 = set_project_settings([params for _, params in cases])
 
     success1 = "error" not in result1 or not result1.get("error")
     success2 = "error" not in result2 or not result2.get("error")
@@ -94,10 +267,10 @@ def test_project_settings() -> bool:
         logger.info("✅ Project settings parameter handling is working")
         return True
     else:
-        logger.error(f"❌ Project settings parameter handling failed")
-        logger.error(f"    Numeric test: {'✅ Passed' if success1 else '❌ Failed'}")
-        logger.error(f"    String test: {'✅ Passed' if success2 else '❌ Failed'}")
-        logger.error(f"    Float test: {'✅ Passed' if success3 else '❌ Failed'}")
+        logger.error("❌ Project settings parameter handling failed")
+        logger.error("    Numeric test: %s", "✅ Passed" if success1 else "❌ Failed")
+        logger.error("    String test: %s", "✅ Passed" if success2 else "❌ Failed")
+        logger.error("    Float test: %s", "✅ Passed" if success3 else "❌ Failed")
         return False
 
 
@@ -106,10 +279,9 @@ def test_color_page_operations() -> bool:
     logger.info("Testing color page operations...")
 
     # Switch to color page
-    result1 = send_request("mcp_davinci_resolve_switch_page", {"page": "color"})
+    result1 = set_page("color")
 
     # Try adding a serial node (should use automatic clip selection)
-    time.sleep(1)  # Give it a moment to switch pages
     result2 = send_request(
         "mcp_davinci_resolve_add_node", {"node_type": "serial", "label": "AutoTest"}
     )
@@ -139,14 +311,23 @@ def test_color_page_operations() -> bool:
         )
         return True
     else:
-        logger.error(f"❌ Color page operations test failed")
+        logger.error("❌ Color page operations test failed")
         logger.error(
-            f"    Switch to color page: {'✅ Passed' if success1 else '❌ Failed'}"
+            "    Switch to color page: %s", "✅ Passed" if success1 else "❌ Failed"
         )
         logger.error(
-            f"    Add node: {'✅ Passed' if success2 else '❌ Failed but proper error' if auto_select_working else '❌ Failed'}"
+            "    Add node: %s",
+            (
+                "✅ Passed"
+                if success2
+                else (
+                    "❌ Failed but proper error" if auto_select_working else "❌ Failed"
+                )
+            ),
+        )
+        logger.error(
+            "    Set color wheel: %s", "✅ Passed" if success3 else "❌ Failed"
         )
-        logger.error(f"    Set color wheel: {'✅ Passed' if success3 else '❌ Failed'}")
         return False
 
 
@@ -155,15 +336,14 @@ def test_render_queue_operations() -> bool:
     logger.info("Testing render queue operations...")
 
     # Switch to deliver page
-    result1 = send_request("mcp_davinci_resolve_switch_page", {"page": "deliver"})
+    result1 = set_page("deliver")
 
     # Clear render queue first (known to be working)
-    result2 = send_request(
-        "mcp_davinci_resolve_clear_render_queue", {"random_string": "test"}
+    result2 = send_request_raw(
+        _CLEAR_RENDER_QUEUE_PAYLOAD, "mcp_davinci_resolve_clear_render_queue"
     )
 
     # Try adding a timeline to the render queue
-    time.sleep(1)  # Give it a moment to switch pages
     result3 = send_request(
         "mcp_davinci_resolve_add_to_render_queue",
         {
@@ -193,15 +373,20 @@ def test_render_queue_operations() -> bool:
         logger.info("✅ Render queue operations are working or properly using helpers")
         return True
     else:
-        logger.error(f"❌ Render queue operations test failed")
+        logger.error("❌ Render queue operations test failed")
         logger.error(
-            f"    Switch to deliver page: {'✅ Passed' if success1 else '❌ Failed'}"
+            "    Switch to deliver page: %s", "✅ Passed" if success1 else "❌ Failed"
         )
         logger.error(
-            f"    Clear render queue: {'✅ Passed' if success2 else '❌ Failed'}"
+            "    Clear render queue: %s", "✅ Passed" if success2 else "❌ Failed"
         )
         logger.error(
-            f"    Add to render queue: {'✅ Passed' if success3 else '❌ Failed but helpers working' if helper_working else '❌ Failed'}"
+            "    Add to render queue: %s",
+            (
+                "✅ Passed"
+                if success3
+                else "❌ Failed but helpers working" if helper_working else "❌ Failed"
+            ),
         )
         return False
 
@@ -220,8 +405,7 @@ def test_error_handling_with_empty_timeline() -> bool:
     )
 
     # Try to perform color operations on empty timeline
-    result1 = send_request("mcp_davinci_resolve_switch_page", {"page": "color"})
-    time.sleep(1)  # Give it a moment to switch pages
+    result1 = set_page("color")
 
     # Try adding a node - this should fail but with proper error message
     result2 = send_request(
@@ -245,7 +429,8 @@ def test_error_handling_with_empty_timeline() -> bool:
             if phrase in error_msg:
                 improved_error = True
                 logger.info(
-                    f"✅ Proper error handling detected: '{phrase}' found in error message"
+                    "✅ Proper error handling detected: '%s' found in error message",
+                    phrase,
                 )
                 break
 
@@ -258,10 +443,11 @@ def test_error_handling_with_empty_timeline() -> bool:
     else:
         logger.error("❌ Error handling for empty timeline test failed")
         logger.error(
-            f"    Switch to color page: {'✅ Passed' if success1 else '❌ Failed'}"
+            "    Switch to color page: %s", "✅ Passed" if success1 else "❌ Failed"
         )
         logger.error(
-            f"    Improved error message: {'✅ Passed' if improved_error else '❌ Failed'}"
+            "    Improved error message: %s",
+            "✅ Passed" if improved_error else "❌ Failed",
         )
         return False
 
@@ -286,13 +472,17 @@ def test_parameter_validation() -> bool:
 
     results = []
 
+    # Writes to the same setting stay in order; the two settings run in parallel
     for test in tests:
-        logger.info(f"Testing {test['type']} parameter: {test['value']}")
-        result = send_request(
-            "mcp_davinci_resolve_set_project_setting",
-            {"setting_name": test["setting"], "setting_value": test["value"]},
-        )
+        logger.info("Testing %s parameter: %s", test["type"], test["value"])
+    responses = set_project_settings(
+        [
+            {"setting_name": test["setting"], "setting_value": test["value"]}
+            for test in tests
+        ]
+    )
 
+    for test, result in zip(tests, responses):
         # Consider it a success if no error or if error doesn't mention type validation
         success = (
             "error" not in result
@@ -302,10 +492,12 @@ def test_parameter_validation() -> bool:
         results.append(success)
 
         if success:
-            logger.info(f"✅ {test['type']} parameter accepted")
+            logger.info("✅ %s parameter accepted", test["type"])
         else:
             logger.error(
-                f"❌ {test['type']} parameter rejected: {result.get('error', 'Unknown error')}"
+                "❌ %s parameter rejected: %s",
+                test["type"],
+                result.get("error", "Unknown error"),
             )
 
     # Final judgment based on how many tests passed
@@ -314,11 +506,11 @@ def test_parameter_validation() -> bool:
     success_rate = passed / total
 
     if success_rate >= 0.5:  # At least half of the tests should pass
-        logger.info(f"✅ Parameter validation is working for {passed}/{total} types")
+        logger.info("✅ Parameter validation is working for %s/%s types", passed, total)
         return True
     else:
         logger.error(
-            f"❌ Parameter validation test failed for {total - passed}/{total} types"
+            "❌ Parameter validation test failed for %s/%s types", total - passed, total
         )
         return False
 
@@ -334,13 +526,13 @@ def print_test_summary(results: Dict[str, bool]) -> None:
 
     for test_name, result in results.items():
         status = "✅ PASSED" if result else "❌ FAILED"
-        logger.info(f"{status} - {test_name}")
+        logger.info("%s - %s", status, test_name)
 
     logger.info("-" * 50)
-    logger.info(f"Total Tests: {total}")
-    logger.info(f"Passed: {passed}")
-    logger.info(f"Failed: {total - passed}")
-    logger.info(f"Success Rate: {passed/total*100:.1f}%")
+    logger.info("Total Tests: %s", total)
+    logger.info("Passed: %s", passed)
+    logger.info("Failed: %s", total - passed)
+    logger.info("Success Rate: %.1f%%", passed / total * 100)
     logger.info("=" * 50)
 
 
@@ -0,0 +1,33 @@
+"""Shared fixtures for utils tests.
+
+The capture tests are marked ``fast`` and run in a plugin-light lane via
+``make test-fast`` (no cacheprovider, no warnings plugin, plain asserts).
+Keep fixtures here cheap and avoid relying on those plugins so the lane
+stays valid.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def cc_module():
+    """Provide the continuous capture module, imported once per session."""
+    from src.utils import capture_continuous
+
+    return capture_continuous
+
+
+@pytest.fixture
+def capture_instance(cc_module, monkeypatch):
+    """Provide a fresh ContinuousCapture with default settings.
+
+    Path.mkdir is stubbed so the default output directory is never created.
+    """
+    monkeypatch.setattr("pathlib.Path.mkdir", lambda *a, **k: None)
+    return cc_module.ContinuousCapture()
+
+
+@pytest.fixture
+def clean_instance(cc_module, monkeypatch):
+    """Clear the global monitoring instance and restore it after the test."""
+    monkeypatch.setattr(cc_module, "_capture_instance", None)
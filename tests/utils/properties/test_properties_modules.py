@@ -2,6 +2,41 @@
 
 from unittest.mock import Mock
 
+import pytest
+
+from src.utils.properties.core import (
+    get_all_project_properties,
+    get_project_property,
+    set_project_property,
+    set_timeline_format,
+)
+from src.utils.properties.settings import (
+    get_timeline_format_settings,
+    get_superscale_settings,
+    set_superscale_settings,
+    get_color_settings,
+    set_color_science_mode,
+    set_color_space,
+    get_project_metadata,
+    get_project_info,
+)
+
+_FORMAT_MAP = {
+    "timelineResolutionWidth": "1920",
+    "timelineResolutionHeight": "1080",
+    "timelineFrameRate": "24",
+}
+
+
+def _format_side_effect(key):
+    return _FORMAT_MAP.get(key)
+
+
+@pytest.fixture
+def project():
+    """Provide a mock Resolve project object."""
+    return Mock()
+
 
 class TestPropertiesModuleImports:
     """Tests that all properties submodules can be imported."""
@@ -74,11 +109,8 @@ class TestPropertiesModuleImports:
 class TestGetAllProjectProperties:
     """Tests for get_all_project_properties function."""
 
-    def test_returns_properties_dict(self):
+    def test_returns_properties_dict(self, project):
         """Should return dictionary of properties."""
-        from src.utils.properties.core import get_all_project_properties
-
-        project = Mock()
         project.GetSetting.return_value = "test_value"
 
         result = get_all_project_properties(project)
@@ -88,22 +120,16 @@ class TestGetAllProjectProperties:
 class TestGetProjectProperty:
     """Tests for get_project_property function."""
 
-    def test_returns_property_value(self):
+    def test_returns_property_value(self, project):
         """Should return property value converted to proper type."""
-        from src.utils.properties.core import get_project_property
-
-        project = Mock()
         project.GetSetting.return_value = "1920"
 
         # timelineResolutionWidth is typed as int, so it gets converted
         result = get_project_property(project, "timelineResolutionWidth")
         assert result == 1920
 
-    def test_returns_none_for_invalid_property(self):
+    def test_returns_none_for_invalid_property(self, project):
         """Should return None for invalid property."""
-        from src.utils.properties.core import get_project_property
-
-        project = Mock()
         project.GetSetting.return_value = None
 
         result = get_project_property(project, "invalidProperty")
@@ -113,40 +139,28 @@ class TestGetProjectProperty:
 class TestSetProjectProperty:
     """Tests for set_project_property function."""
 
-    def test_returns_true_on_success(self):
-        """Should return True on successful set."""
-        from src.utils.properties.core import set_project_property
-
-        project = Mock()
-        project.SetSetting.return_value = True
+    @pytest.mark.parametrize(
+        "setting,value,return_val,expected",
+        [
+            ("timelineResolutionWidth", "1920", True, True),
+            ("invalidProperty", "value", False, False),
+        ],
+    )
+    def test_returns_set_setting_result(
+        self, project, setting, value, return_val, expected
+    ):
+        """Should return True on success and False on failed set."""
+        project.SetSetting.return_value = return_val
 
-        result = set_project_property(project, "timelineResolutionWidth", "1920")
-        assert result is True
-
-    def test_returns_false_on_failure(self):
-        """Should return False on failed set."""
-        from src.utils.properties.core import set_project_property
-
-        project = Mock()
-        project.SetSetting.return_value = False
-
-        result = set_project_property(project, "invalidProperty", "value")
-        assert result is False
+        assert set_project_property(project, setting, value) is expected
 
 
 class TestGetTimelineFormatSettings:
     """Tests for get_timeline_format_settings function."""
 
-    def test_returns_format_dict(self):
+    def test_returns_format_dict(self, project):
         """Should return dictionary with format settings."""
-        from src.utils.properties.settings import get_timeline_format_settings
-
-        project = Mock()
-        project.GetSetting.side_effect = lambda key: {
-            "timelineResolutionWidth": "1920",
-            "timelineResolutionHeight": "1080",
-            "timelineFrameRate": "24",
-        }.get(key)
+        project.GetSetting.side_effect = _format_side_effect
 
         result = get_timeline_format_settings(project)
         assert isinstance(result, dict)
@@ -155,35 +169,19 @@ class TestGetTimelineFormatSettings:
 class TestSetTimelineFormat:
     """Tests for set_timeline_format function."""
 
-    def test_returns_true_on_success(self):
-        """Should return True on successful format set."""
-        from src.utils.properties.core import set_timeline_format
-
-        project = Mock()
-        project.SetSetting.return_value = True
+    @pytest.mark.parametrize("return_val,expected", [(True, True), (False, False)])
+    def test_returns_set_setting_result(self, project, return_val, expected):
+        """Should return True on success and False when any setting fails."""
+        project.SetSetting.return_value = return_val
 
-        result = set_timeline_format(project, 1920, 1080, 24.0)
-        assert result is True
-
-    def test_returns_false_on_failure(self):
-        """Should return False when any setting fails."""
-        from src.utils.properties.core import set_timeline_format
-
-        project = Mock()
-        project.SetSetting.return_value = False
-
-        result = set_timeline_format(project, 1920, 1080, 24.0)
-        assert result is False
+        assert set_timeline_format(project, 1920, 1080, 24.0) is expected
 
 
 class TestGetSuperscaleSettings:
     """Tests for get_superscale_settings function."""
 
-    def test_returns_settings_dict(self):
+    def test_returns_settings_dict(self, project):
         """Should return dictionary with superscale settings."""
-        from src.utils.properties.settings import get_superscale_settings
-
-        project = Mock()
         project.GetSetting.return_value = "1"
 
         result = get_superscale_settings(project)
@@ -193,25 +191,19 @@ class TestGetSuperscaleSettings:
 class TestSetSuperscaleSettings:
     """Tests for set_superscale_settings function."""
 
-    def test_returns_true_on_success(self):
-        """Should return True on successful set."""
-        from src.utils.properties.settings import set_superscale_settings
-
-        project = Mock()
-        project.SetSetting.return_value = True
+    @pytest.mark.parametrize("return_val,expected", [(True, True), (False, False)])
+    def test_returns_set_setting_result(self, project, return_val, expected):
+        """Should return True on success and False on failed set."""
+        project.SetSetting.return_value = return_val
 
-        result = set_superscale_settings(project, True, 1)
-        assert result is True
+        assert set_superscale_settings(project, True, 1) is expected
 
 
 class TestGetColorSettings:
     """Tests for get_color_settings function."""
 
-    def test_returns_settings_dict(self):
+    def test_returns_settings_dict(self, project):
         """Should return dictionary with color settings."""
-        from src.utils.properties.settings import get_color_settings
-
-        project = Mock()
         project.GetSetting.return_value = "DaVinci YRGB"
 
         result = get_color_settings(project)
@@ -221,39 +213,30 @@ class TestGetColorSettings:
 class TestSetColorScienceMode:
     """Tests for set_color_science_mode function."""
 
-    def test_returns_true_on_success(self):
-        """Should return True on successful set."""
-        from src.utils.properties.settings import set_color_science_mode
-
-        project = Mock()
-        project.SetSetting.return_value = True
+    @pytest.mark.parametrize("return_val,expected", [(True, True), (False, False)])
+    def test_returns_set_setting_result(self, project, return_val, expected):
+        """Should return True on success and False on failed set."""
+        project.SetSetting.return_value = return_val
 
-        result = set_color_science_mode(project, "DaVinci YRGB")
-        assert result is True
+        assert set_color_science_mode(project, "DaVinci YRGB") is expected
 
 
 class TestSetColorSpace:
     """Tests for set_color_space function."""
 
-    def test_returns_true_on_success(self):
-        """Should return True on successful set."""
-        from src.utils.properties.settings import set_color_space
-
-        project = Mock()
-        project.SetSetting.return_value = True
+    @pytest.mark.parametrize("return_val,expected", [(True, True), (False, False)])
+    def test_returns_set_setting_result(self, project, return_val, expected):
+        """Should return True on success and False on failed set."""
+        project.SetSetting.return_value = return_val
 
-        result = set_color_space(project, "Rec.709", "Rec.709 Gamma")
-        assert result is True
+        assert set_color_space(project, "Rec.709", "Rec.709 Gamma") is expected
 
 
 class TestGetProjectMetadata:
     """Tests for get_project_metadata function."""
 
-    def test_returns_metadata_dict(self):
+    def test_returns_metadata_dict(self, project):
         """Should return dictionary with metadata."""
-        from src.utils.properties.settings import get_project_metadata
-
-        project = Mock()
         project.GetName.return_value = "TestProject"
 
         result = get_project_metadata(project)
@@ -263,11 +246,8 @@ class TestGetProjectMetadata:
 class TestGetProjectInfo:
     """Tests for get_project_info function."""
 
-    def test_returns_info_dict(self):
+    def test_returns_info_dict(self, project):
         """Should return dictionary with project info."""
-        from src.utils.properties.settings import get_project_info
-
-        project = Mock()
         project.GetName.return_value = "TestProject"
         project.GetSetting.return_value = "value"
 
@@ -1,134 +1,136 @@
 """Tests for continuous capture module."""
 
-from unittest.mock import Mock, patch
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.utils.capture_continuous import CaptureStatus, ContinuousCapture
+
+pytestmark = pytest.mark.fast
+
+
+@pytest.fixture(autouse=True)
+def _no_mkdir(monkeypatch):
+    """Keep ContinuousCapture from creating its output directory."""
+    monkeypatch.setattr("pathlib.Path.mkdir", lambda *a, **k: None)
+
+
+class _FakeThread:
+    """Thread stand-in that never spawns an OS thread."""
+
+    def __init__(self, target=None, daemon=None, **kwargs):
+        self.target = target
+        self.daemon = daemon
+
+    def start(self):
+        pass
+
+    def join(self, timeout=None):
+        pass
 
 
 class TestContinuousCapture:
     """Tests for ContinuousCapture class."""
 
-    def test_init_creates_output_dir(self):
+    def test_init_creates_output_dir(self, monkeypatch):
         """Should create output directory on init."""
-        from src.utils.capture_continuous import ContinuousCapture
+        calls = 0
 
-        with patch("pathlib.Path.mkdir") as mock_mkdir:
-            _capture = ContinuousCapture(output_dir="/tmp/test_capture")  # noqa: F841
-            mock_mkdir.assert_called_once()
-
-    def test_start_sets_running_flag(self):
-        """Should set running flag when started."""
-        from src.utils.capture_continuous import ContinuousCapture
+        def _count_mkdir(self, *args, **kwargs):
+            nonlocal calls
+            calls += 1
 
-        with patch("pathlib.Path.mkdir"):
-            capture = ContinuousCapture()
+        monkeypatch.setattr("pathlib.Path.mkdir", _count_mkdir)
 
-            with patch.object(capture, "_capture_loop"):
-                capture.start()
-                assert capture.running is True
-                capture.stop()
+        ContinuousCapture(output_dir="/tmp/test_capture")
+        assert calls == 1
 
-    def test_stop_clears_running_flag(self):
+    def test_start_sets_running_flag(self, capture_instance, cc_module, monkeypatch):
+        """Should set running flag when started."""
+        monkeypatch.setattr(cc_module, "threading", SimpleNamespace(Thread=_FakeThread))
+        capture_instance.start()
+        try:
+            assert capture_instance.running is True
+        finally:
+            capture_instance.running = False
+            capture_instance.thread = None
+
+    def test_stop_clears_running_flag(self, capture_instance):
         """Should clear running flag when stopped."""
-        from src.utils.capture_continuous import ContinuousCapture
-
-        with patch("pathlib.Path.mkdir"):
-            capture = ContinuousCapture()
-            capture.running = True
-            capture.thread = None
-            capture.stop()
-            assert capture.running is False
+        capture_instance.running = True
+        capture_instance.thread = None
+        capture_instance.stop()
+        assert capture_instance.running is False
 
-    def test_get_status_returns_correct_info(self):
+    def test_get_status_returns_correct_info(self, capture_instance):
         """Should return correct status information."""
-        from src.utils.capture_continuous import ContinuousCapture
-
-        with patch("pathlib.Path.mkdir"):
-            capture = ContinuousCapture(
-                output_dir="/tmp/test",
-                interval_sec=2.0,
-                quality=80,
-            )
-            capture.running = True
-            capture.session_id = "test_session"
-            capture.screenshot_count = 5
+        capture = capture_instance
+        capture.output_dir = Path("/tmp/test")
+        capture.interval_sec = 2.0
+        capture.quality = 80
+        capture.running = True
+        capture.session_id = "test_session"
+        capture.screenshot_count = 5
 
-            status = capture.get_status()
+        status = capture.get_status()
 
-            assert status["running"] is True
-            assert status["session_id"] == "test_session"
-            assert status["screenshot_count"] == 5
-            assert status["interval_sec"] == 2.0
+        assert status.running is True
+        assert status.session_id == "test_session"
+        assert status.screenshot_count == 5
+        assert status.output_dir == str(Path("/tmp/test"))
+        assert status.interval_sec == 2.0
 
 
 class TestStartMonitoring:
     """Tests for start_monitoring function."""
 
-    def test_returns_error_when_already_running(self):
+    def test_returns_error_when_already_running(self, cc_module, monkeypatch):
         """Should return error when monitoring already running."""
-        from src.utils import capture_continuous
-
         # Create a mock running instance
-        mock_instance = Mock()
-        mock_instance.running = True
+        mock_instance = SimpleNamespace(running=True)
+        monkeypatch.setattr(cc_module, "_capture_instance", mock_instance)
 
-        with patch.object(capture_continuous, "_capture_instance", mock_instance):
-            result = capture_continuous.start_monitoring()
-            assert result["success"] is False
-            assert "already running" in result["error"]
+        result = cc_module.start_monitoring()
+        assert result["success"] is False
+        assert "already running" in result["error"]
 
-    def test_starts_monitoring_successfully(self):
+    def test_starts_monitoring_successfully(
+        self, cc_module, clean_instance, monkeypatch
+    ):
         """Should start monitoring successfully."""
-        from src.utils import capture_continuous
-
-        # Reset the global instance
-        capture_continuous._capture_instance = None
+        monkeypatch.setattr(cc_module, "threading", SimpleNamespace(Thread=_FakeThread))
 
-        with patch("pathlib.Path.mkdir"):
-            with patch.object(capture_continuous.ContinuousCapture, "_capture_loop"):
-                result = capture_continuous.start_monitoring(interval_sec=1.0)
-                assert result["success"] is True
-                assert "session_id" in result
+        result = cc_module.start_monitoring(interval_sec=1.0)
+        assert result["success"] is True
+        assert "session_id" in result
 
-                # Clean up
-                capture_continuous.stop_monitoring()
+        # Clean up
+        cc_module.stop_monitoring()
 
 
 class TestStopMonitoring:
     """Tests for stop_monitoring function."""
 
-    def test_returns_error_when_not_running(self):
+    def test_returns_error_when_not_running(self, cc_module, clean_instance):
         """Should return error when monitoring not running."""
-        from src.utils import capture_continuous
-
-        capture_continuous._capture_instance = None
-
-        result = capture_continuous.stop_monitoring()
+        result = cc_module.stop_monitoring()
         assert result["success"] is False
 
 
 class TestGetMonitoringStatus:
     """Tests for get_monitoring_status function."""
 
-    def test_returns_not_running_when_no_instance(self):
+    def test_returns_not_running_when_no_instance(self, cc_module, clean_instance):
         """Should return not running when no instance exists."""
-        from src.utils import capture_continuous
-
-        capture_continuous._capture_instance = None
-
-        result = capture_continuous.get_monitoring_status()
+        result = cc_module.get_monitoring_status()
         assert result["running"] is False
 
-    def test_returns_status_when_instance_exists(self):
+    def test_returns_status_when_instance_exists(self, cc_module, monkeypatch):
         """Should return status when instance exists."""
-        from src.utils import capture_continuous
-
-        mock_instance = Mock()
-        mock_instance.get_status.return_value = {
-            "running": True,
-            "session_id": "test",
-            "screenshot_count": 10,
-        }
-
-        with patch.object(capture_continuous, "_capture_instance", mock_instance):
-            result = capture_continuous.get_monitoring_status()
-            assert result["running"] is True
-            assert result["screenshot_count"] == 10
+        status = CaptureStatus(True, "test", 10, "/tmp/test", 1.0)
+        mock_instance = SimpleNamespace(get_status=lambda: status)
+        monkeypatch.setattr(cc_module, "_capture_instance", mock_instance)
+
+        result = cc_module.get_monitoring_status()
+        assert result["running"] is True
+        assert result["screenshot_count"] == 10